@@ -1,11 +1,34 @@
 """Control file for automation beyond pre-commit."""
 
+import hashlib
+from pathlib import Path
+
 from nox_poetry import Session, session
 
+# Changes to these files are the only reason to re-run `poetry install` in a reused venv.
+DEPENDENCY_FILES = ("poetry.lock", "pyproject.toml")
+
+
+def _install_dev_dependencies(session: Session) -> None:
+    """Install the project with dev dependencies, unless the reused venv already has them."""
+    digest = hashlib.sha256()
+    for name in DEPENDENCY_FILES:
+        digest.update(Path(name).read_bytes())
+    sentinel = Path(session.virtualenv.location) / ".lockhash"
+    if sentinel.is_file() and sentinel.read_text() == digest.hexdigest():
+        session.log("Dependencies unchanged since the last install")
+        return
+    # with --no-install, nox skips run_always() in a reused venv and returns None
+    if (
+        session.run_always("poetry", "install", "--with", "dev", external=True)
+        is not None
+    ):
+        sentinel.write_text(digest.hexdigest())
+
 
-@session(python=["3.12"])
+@session(python=["3.12"], reuse_venv=True)
 def test_locally(session: Session) -> None:
     """Run tests that don't need networked resources."""
     args = session.posargs or ["--cov"]
-    session.run_always("poetry", "install", "--with", "dev", external=True)
+    _install_dev_dependencies(session)
     session.run("python", "-m", "pytest", *args)
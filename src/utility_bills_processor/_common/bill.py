@@ -5,19 +5,66 @@ import logging
 import re
 from abc import abstractmethod
 from pathlib import Path
-from typing import ClassVar, Iterable, TypeVar
+from typing import Any, ClassVar, Final, Iterable, TypeVar
 
-from .readers import PdfReader, read_pdf
+from .executors import executor_for
+from .readers import PdfReader, read_pdf_pages
 
 B = TypeVar("B", bound="Bill")
 
+# unlike the logging.debug() shortcuts, doesn't configure the root logger in library use
+_LOGGER: Final = logging.getLogger(__name__)
+
+
+def compile_patterns(*patterns: str) -> tuple[re.Pattern[str], ...]:
+    """Compile the field patterns of a bill.
+
+    Each pattern should be small and start with a literal anchor from the bill text rather than
+    `.*`, so that a search is a single linear scan instead of backtracking across the document.
+
+    Args:
+        patterns: regular expressions with named groups for the fields
+
+    Returns:
+        the compiled patterns, in the same order
+    """
+    return tuple(re.compile(p, re.DOTALL) for p in patterns)
+
+
+def to_cents(usd: float) -> int:
+    """Convert a dollar amount to whole cents, so that sums of amounts compare exactly.
+
+    Args:
+        usd: an amount of US dollars, possibly with fractions of a cent
+
+    Returns:
+        the amount rounded to the nearest cent
+    """
+    return round(usd * 100)
+
 
 class Bill:
     """The validated relevant fields of a PDF bill."""
 
+    # subclasses are slotted dataclasses, which only drop the instance __dict__ if every base
+    # declares __slots__ too
+    __slots__ = ()
+
     _patterns: ClassVar[tuple[str, ...]] = ("NOT SET ON SUBCLASS",)
+    _compiled_patterns: ClassVar[tuple[re.Pattern[str], ...]] = ()
     _header: ClassVar[tuple[str, ...]] = ("NOT SET ON SUBCLASS",)
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Compile the subclass patterns once, when the class is defined.
+
+        Subclasses that don't declare their own `_patterns` inherit the compiled ones, and the
+        class that `@dataclass(slots=True)` creates keeps those already compiled for the original.
+        """
+        super().__init_subclass__(**kwargs)
+        attributes = vars(cls)
+        if "_patterns" in attributes and "_compiled_patterns" not in attributes:
+            cls._compiled_patterns = compile_patterns(*cls._patterns)
+
     @property
     @abstractmethod
     def date(self) -> datetime.date:
@@ -45,20 +92,20 @@ class Bill:
         pass
 
     @classmethod
-    def pick_patterns(cls, text: str, reader: PdfReader) -> Iterable[str]:
+    def pick_patterns(cls, text: str, reader: PdfReader) -> Iterable[re.Pattern[str]]:
         """Pick which set of patterns to use.
 
         Useful to override when the format of the bill has changed enough that the same regex can't
         be used.
 
         Args:
-            text: the text of the PDF
+            text: the text of the first page of the PDF
             reader: the reader with other parsing information
 
         Returns:
-            an iterable of pattern strings
+            an iterable of compiled patterns
         """
-        return cls._patterns
+        return cls._compiled_patterns
 
     @classmethod
     def to_header(cls) -> tuple[str, ...]:
@@ -80,21 +127,76 @@ class Bill:
         Returns:
             a Bill instance
         """
-        text, reader = read_pdf(file, password)
+        pages, reader = read_pdf_pages(file, password)
+        text = next(pages, "")
         patterns = cls.pick_patterns(text, reader)
 
+        # Most bills have all their fields on the first page or two, so only extract the next
+        # page while some pattern still hasn't matched.
         values = {}
-        for pattern in patterns:
-            match = re.search(pattern, text, flags=re.DOTALL)
-            if match is None:
+        while True:
+            unmatched = []
+            for pattern in patterns:
+                match = pattern.search(text)
+                if match is None:
+                    unmatched.append(pattern)
+                else:
+                    values.update(match.groupdict())
+            if not unmatched:
+                break
+            page = next(pages, None)
+            # a page without text, e.g. a scanned insert, can't match anything new
+            while page is not None and not page.strip():
+                page = next(pages, None)
+            if page is None:
+                missing = [name for pattern in unmatched for name in pattern.groupindex]
                 raise RuntimeError(
-                    f"Cannot parse bill with pattern: '{pattern}'. Found text:\n{text}"
+                    f"Cannot parse bill fields {', '.join(missing)}"
+                    f" with pattern: '{unmatched[0].pattern}'. Found text:\n{text}"
                 )
-            values.update(match.groupdict())
+            text = f"{text}\n\n{page}"
+            patterns = unmatched
 
-        # on the root logger
-        logging.debug(f"Parsed text\n{text}")
-        logging.debug(f"Extracted fields:\n{values}")
+        # %-style arguments are only formatted if a handler accepts the record
+        _LOGGER.debug("Parsed text\n%s", text)
+        _LOGGER.debug("Extracted fields:\n%s", values)
         if len(values) == 0:
             raise RuntimeError(f"Cannot parse bill. Found text:\n{text}")
         return cls(**values)
+
+    @classmethod
+    def extract_many(
+        cls: type[B],
+        files: Iterable[Path],
+        password: str | None = None,
+        max_workers: int | None = None,
+    ) -> list[B]:
+        """Extract Bills from many PDF files, in parallel worker processes.
+
+        Args:
+            files: pointers to valid PDF files, may be encrypted
+            password: the password to unlock all encrypted PDF files
+            max_workers: the most worker processes to start, defaults to the number of CPUs
+
+        Returns:
+            a Bill instance per file, in the same order
+
+        Raises:
+            RuntimeError: naming the first file, in order, that couldn't be parsed
+        """
+        files = list(files)
+        with executor_for(len(files), max_workers) as executor:
+            futures = [
+                executor.submit(cls.extract_fields, file, password) for file in files
+            ]
+            bills = []
+            for file, future in zip(files, futures):
+                try:
+                    bills.append(future.result())
+                except RuntimeError as error:
+                    for pending in futures:
+                        pending.cancel()
+                    raise RuntimeError(
+                        f"Cannot parse bill file {file}: {error}"
+                    ) from error
+            return bills
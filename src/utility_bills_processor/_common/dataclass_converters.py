@@ -1,12 +1,17 @@
 """Classes to help with value and type conversions for @dataclass fields."""
 
+import warnings
 from typing import Any, Callable, Generic, TypeVar
 
 T = TypeVar("T")
 
 
 class ConversionDescriptor(Generic[T]):
-    """A Dataclass-style converter to adapt the value to another value and/or type."""
+    """A Dataclass-style converter to adapt the value to another value and/or type.
+
+    Deprecated: bills are slotted dataclasses that convert their fields once in `__post_init__`,
+    which avoids a Python-level `__get__`/`__set__` call on every attribute access.
+    """
 
     def __init__(self, _default: T, converter: Callable[[Any], T]):
         """Use like a Dataclass field.
@@ -15,6 +20,11 @@ class ConversionDescriptor(Generic[T]):
             _default: the default value if one is not explicitly set
             converter: a function to convert the value to another value and/or type
         """
+        warnings.warn(
+            "ConversionDescriptor is deprecated, convert fields in __post_init__ instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         self._default: T = _default
         self._converter = converter
 
@@ -0,0 +1,41 @@
+"""Executors to parse many bills side by side."""
+
+import os
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Callable, ParamSpec, TypeVar, override
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+
+class InlineExecutor(Executor):
+    """Runs each call as it is submitted, in this process."""
+
+    @override
+    def submit(  # noqa: D102
+        self, fn: Callable[_P, _T], /, *args: _P.args, **kwargs: _P.kwargs
+    ) -> Future[_T]:
+        future: Future[_T] = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as error:
+            future.set_exception(error)
+        return future
+
+
+def executor_for(jobs: int, max_workers: int | None = None) -> Executor:
+    """Pick where to parse bills.
+
+    PDF text extraction is CPU-bound and independent per file, so files are parsed in worker
+    processes, unless a single job (or none) doesn't make starting them worthwhile.
+
+    Args:
+        jobs: the number of files that need parsing
+        max_workers: the most worker processes to start, defaults to the number of CPUs
+
+    Returns:
+        a process pool no larger than the jobs or workers, or an executor that runs in this process
+    """
+    if jobs <= 1:
+        return InlineExecutor()
+    return ProcessPoolExecutor(min(jobs, max_workers or os.cpu_count() or 1))
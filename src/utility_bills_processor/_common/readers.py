@@ -1,15 +1,19 @@
 """Functions to parse files."""
 
 from pathlib import Path
+from typing import Iterator
 
 from pypdf import PdfReader
 
 
-def read_pdf(file: Path, password: str | None) -> tuple[str, PdfReader]:
-    """Read PDF file that could be encrypted.
+def read_pdf_pages(file: Path, password: str | None) -> tuple[Iterator[str], PdfReader]:
+    """Open a PDF file that could be encrypted, without extracting any text yet.
+
+    Text extraction is the slowest part of reading a bill, so pages are only extracted as the
+    caller consumes them.
 
     Returns:
-        the contents of the PDF file as text
+        an iterator over the text of each page, and the reader with other parsing information
 
     Raises:
         RuntimeError: if the file is encrypted but no password was provided
@@ -20,5 +24,17 @@ def read_pdf(file: Path, password: str | None) -> tuple[str, PdfReader]:
         if password is None:
             raise RuntimeError("Cannot read an encrypted document without a password")
         reader.decrypt(password)
-    text = "\n\n".join((page.extract_text() for page in reader.pages))
-    return text, reader
+    return (page.extract_text() for page in reader.pages), reader
+
+
+def read_pdf(file: Path, password: str | None) -> tuple[str, PdfReader]:
+    """Read PDF file that could be encrypted.
+
+    Returns:
+        the contents of the PDF file as text
+
+    Raises:
+        RuntimeError: if the file is encrypted but no password was provided
+    """
+    pages, reader = read_pdf_pages(file, password)
+    return "\n\n".join(pages), reader
@@ -1,15 +1,26 @@
 """The CLI for this package."""
 
+import contextlib
+import csv
+import importlib
 import logging
+import os
+import sys
+from concurrent.futures import Future
+from operator import attrgetter
 from pathlib import Path
-from typing import Final, Type
+from typing import TYPE_CHECKING, ContextManager, Final, MutableMapping, Type
 
 import click
 import colorlog
 from colorlog import escape_codes
 
 from . import __version__
-from ._common.bill import Bill
+from ._common.executors import executor_for
+
+if TYPE_CHECKING:
+    # the bill modules import pypdf, so only load them when a command runs
+    from ._common.bill import Bill
 
 _RESET_COLOR: Final[str] = escape_codes.escape_codes["reset"]
 
@@ -35,14 +46,109 @@ def _configure_logging(level: int = logging.INFO) -> None:
     logger.addHandler(handler)
 
 
-def _base_command(scope: str, bill_subtype: Type[Bill]) -> click.Command:
+def _open_cache(enabled: bool) -> ContextManager[MutableMapping[str, "Bill"]]:
+    """Open the store of bills parsed by earlier runs.
+
+    Args:
+        enabled: when false, a throwaway in-memory store is used instead
+
+    Returns:
+        a context manager for a mapping of `_cache_key()` to parsed bills
+    """
+    if not enabled:
+        return contextlib.nullcontext({})
+    import dbm
+    import shelve  # noqa: S403
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    cache_dir = Path(cache_home) / "utility_bills_processor"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # the shelf is private to the user and only holds what this CLI pickled into it
+        return shelve.open(str(cache_dir / "bills"))  # noqa: S301
+    # dbm.dumb raises SyntaxError for a corrupt index
+    except (OSError, SyntaxError, *dbm.error) as error:
+        logging.warning(
+            "Not caching bills, cannot open the cache in %s: %s", cache_dir, error
+        )
+        return contextlib.nullcontext({})
+
+
+def _parser_fingerprint(bill_subtype: Type["Bill"]) -> str | None:
+    """Identify the code that parses a type of bill, so that changing it invalidates the cache.
+
+    The modules of the bill class and its bases hold its patterns, fields and conversions; the
+    reader module and the pypdf version decide the text that the patterns are matched against.
+
+    Returns:
+        a hex digest, or None if the sources aren't installed, e.g. in a frozen application
+    """
+    import hashlib
+    import inspect
+
+    import pypdf
+
+    modules = {cls.__module__ for cls in bill_subtype.__mro__ if cls is not object}
+    modules.add(f"{__name__.rpartition('.')[0]}._common.readers")
+    digest = hashlib.sha256(pypdf.__version__.encode())
+    for module in sorted(modules):
+        try:
+            source = inspect.getsource(importlib.import_module(module))
+        except OSError as error:
+            logging.warning(
+                "Not caching bills, cannot read the parsing code: %s", error
+            )
+            return None
+        digest.update(source.encode())
+    return digest.hexdigest()
+
+
+def _cache_key(fingerprint: str, bill_file: Path) -> str:
+    """Identify a parse of the file's contents by unchanged parsing code.
+
+    Keying by content rather than path and modification time keeps a copied, moved or touched
+    bill cached, and hashing a bill takes far less time than extracting its text.
+
+    Args:
+        fingerprint: the `_parser_fingerprint()` of the type of bill
+        bill_file: the PDF file of the bill
+    """
+    import hashlib
+
+    digest = hashlib.sha256(bill_file.read_bytes()).hexdigest()
+    return ":".join((__version__, fingerprint, digest))
+
+
+def _load_cached(cached_bills: MutableMapping[str, "Bill"], key: str) -> "Bill | None":
+    """Look up a bill parsed by an earlier run, counting an unloadable entry as missing."""
+    try:
+        return cached_bills.get(key)
+    except Exception as error:  # unpickling can raise almost anything
+        logging.debug("Ignoring unreadable cached bill %s: %r", key, error)
+        return None
+
+
+def _store_cached(
+    cached_bills: MutableMapping[str, "Bill"], key: str, bill: "Bill"
+) -> None:
+    """Save a parsed bill for later runs, carrying on without it if the cache can't be written."""
+    import dbm
+
+    try:
+        cached_bills[key] = bill
+    except (OSError, *dbm.error) as error:
+        logging.warning("Not caching bill %s: %s", key, error)
+
+
+def _base_command(scope: str, bill_module: str, bill_class: str) -> click.Command:
     """A factory function for defining bill processing commands.
 
     This function ensures consistent parameters and behavior of those parameters.
 
     Args:
         scope: the text name of the bill, e.g. gas
-        bill_subtype: the concrete class that represents the bill, e.g. GasBill
+        bill_module: the module of the class, relative to this package, e.g. .national_grid_gas
+        bill_class: the name of the concrete class that represents the bill, e.g. GasBill
 
     Returns:
         a function decorated by `@click.command` that will be invoked based on CLI parameters
@@ -63,6 +169,11 @@ def _base_command(scope: str, bill_subtype: Type[Bill]) -> click.Command:
         hide_input=True,
         help="Use if the file(s) are encrypted.",
     )
+    @click.option(
+        "--cache/--no-cache",
+        default=True,
+        help="Reuse bills parsed by earlier runs from unchanged, unencrypted files.",
+    )
     @click.argument(
         "bill_files",
         type=click.Path(
@@ -79,30 +190,73 @@ def _base_command(scope: str, bill_subtype: Type[Bill]) -> click.Command:
         bill_files: tuple[Path],
         password: str | None,
         check: bool,
+        cache: bool,
     ) -> None:
         """Extract data from BILL_FILES.
 
         A BILL_FILE must be PDF and may be encrypted. Use --password to decrypt.
         """
-        bills = []
-        for bill_file in bill_files:
-            try:
-                bill = bill_subtype.extract_fields(bill_file, password)
-                if check:
-                    bill.validate()
-                else:
-                    click.secho("Skipping data checks", fg="yellow")
-                bills.append(bill)
-
-            except RuntimeError as error:
-                message = f"Failed to process as a {scope} bill: {str(bill_file)}"
-                logging.error(f"{message}{_RESET_COLOR} {str(error)}")
-                raise click.ClickException(message) from error
-        bills.sort(key=lambda b: b.date)
+        bill_subtype: Type[Bill] = getattr(
+            importlib.import_module(bill_module, __package__), bill_class
+        )
+        parsed: dict[Path, Bill] = {}
+        # Paths are resolved, so a file listed more than once (e.g. by overlapping globs)
+        # is parsed once and repeated in the output.
+        unique_files = list(dict.fromkeys(bill_files))
+        # Decrypted bills are never written to the cache.
+        fingerprint = (
+            _parser_fingerprint(bill_subtype) if cache and password is None else None
+        )
+        with _open_cache(fingerprint is not None) as cached_bills:
+            keys: dict[Path, str] = {}
+            cached: dict[Path, Bill] = {}
+            if fingerprint is not None:
+                for bill_file in unique_files:
+                    keys[bill_file] = _cache_key(fingerprint, bill_file)
+                    cached_bill = _load_cached(cached_bills, keys[bill_file])
+                    if cached_bill is not None:
+                        cached[bill_file] = cached_bill
+            # check the results in the order they were given
+            with executor_for(len(unique_files) - len(cached)) as executor:
+                futures: list[Future[Bill]] = []
+                for bill_file in unique_files:
+                    if bill_file in cached:
+                        future: Future[Bill] = Future()
+                        future.set_result(cached[bill_file])
+                    else:
+                        future = executor.submit(
+                            bill_subtype.extract_fields, bill_file, password
+                        )
+                    futures.append(future)
+
+                for bill_file, future in zip(unique_files, futures):
+                    try:
+                        bill = future.result()
+                        if bill_file in keys and bill_file not in cached:
+                            _store_cached(cached_bills, keys[bill_file], bill)
+                        if check:
+                            bill.validate()
+                        else:
+                            click.secho("Skipping data checks", fg="yellow")
+                        parsed[bill_file] = bill
+
+                    except RuntimeError as error:
+                        for pending in futures:
+                            pending.cancel()
+                        message = (
+                            f"Failed to process as a {scope} bill: {str(bill_file)}"
+                        )
+                        logging.error(f"{message}{_RESET_COLOR} {str(error)}")
+                        raise click.ClickException(message) from error
+        bills = [parsed[bill_file] for bill_file in bill_files]
+        bills.sort(key=attrgetter("date"))
         click.echo("-" * 80)
-        print(", ".join(map(str, bills[0].to_header())))
-        for bill in bills:
-            print(",".join(map(str, bill.to_row())))
+        header = bills[0].to_header()
+        print(", ".join(header))
+        # csv quotes any text field that holds a comma
+        csv.writer(sys.stdout, lineterminator="\n").writerows(
+            bill.to_row() for bill in bills
+        )
 
     return command
 
@@ -124,12 +278,14 @@ def process_utility_bill(verbose: bool) -> None:
 
 
 def _generate_commands() -> None:
-    # Defer importing bill classes as long as possible.
-    from .national_grid_gas import GasBill
-    from .water_and_sewer import WaterBill
-
-    process_utility_bill.add_command(_base_command("gas", GasBill), "gas")
-    process_utility_bill.add_command(_base_command("water", WaterBill), "water")
+    # Bill classes are imported by name when their command runs, so --help and --version
+    # don't pay for importing pypdf.
+    process_utility_bill.add_command(
+        _base_command("gas", ".national_grid_gas", "GasBill"), "gas"
+    )
+    process_utility_bill.add_command(
+        _base_command("water", ".water_and_sewer", "WaterBill"), "water"
+    )
 
 
 _generate_commands()
@@ -1,12 +1,13 @@
 """Represents and validates a National Grid Gas bill PDF."""
 
 import logging
+import re
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
-from typing import ClassVar, Iterable, override
+from datetime import date
+from operator import attrgetter
+from typing import ClassVar, Final, Iterable, override
 
-from ._common.bill import Bill
-from ._common.dataclass_converters import ConversionDescriptor
+from ._common.bill import Bill, compile_patterns, to_cents
 from ._common.readers import PdfReader
 
 __EXAMPLE_OLD_BILL = """
@@ -55,130 +56,148 @@ def _spaced_optional_float(value: str | float | None) -> float | None:
     return _spaced_float(value) if value is not None else None
 
 
-@dataclass
+_LOGGER: Final = logging.getLogger(__name__)
+
+_MONTHS: Final[dict[str, int]] = {
+    name: number
+    for number, name in enumerate(
+        (
+            "Jan",
+            "Feb",
+            "Mar",
+            "Apr",
+            "May",
+            "Jun",
+            "Jul",
+            "Aug",
+            "Sep",
+            "Oct",
+            "Nov",
+            "Dec",
+        ),
+        start=1,
+    )
+}
+
+
+def _parse_bill_date(value: str | date) -> date:
+    """Parse "Apr 19 2024" (old layout) or "Jul 20, 2024" (current layout).
+
+    Equivalent to `strptime` with "%b %d %Y" or "%b %d, %Y", without interpreting a format string
+    on every call.
+    """
+    if isinstance(value, date):
+        return value
+    month, day, year = value.replace(",", " ").split()
+    try:
+        return date(int(year), _MONTHS[month.title()], int(day))
+    except KeyError as error:
+        raise ValueError(f"Unknown month in date: {value!r}") from error
+
+
+# the to_row() values after the date, fetched in one C-level call
+_ROW_FIELDS: Final = attrgetter(
+    "days_since_last_reading",
+    "current_meter_reading",
+    "previous_meter_reading",
+    "thermal_factor",
+    "total_therms",
+    "delivery_min_rate_usd",
+    "delivery_first_tier_rate_usd",
+    "delivery_distribution_adjustment_rate_usd",
+    "delivery_total_usd",
+    "supply_rate_usd",
+    "supply_total_usd",
+    "paperless_bill_credit_usd",
+    "total_usd",
+)
+
+
+@dataclass(slots=True)
 class GasBill(Bill):
-    """A Data Object representation of a Gas Bill."""
+    """A Data Object representation of a Gas Bill.
+
+    Fields may be given as the text extracted from the bill; `__post_init__` converts them once.
+    """
 
     current_method: str
     previous_method: str
-    days_since_last_reading: ConversionDescriptor = ConversionDescriptor(
-        _default=0, converter=_spaced_int
-    )
-    current_date: ConversionDescriptor = ConversionDescriptor(
-        _default=date(1970, 1, 1),
-        converter=lambda x: (
-            datetime.strptime(x, "%b %d, %Y")
-            if "," in x
-            else datetime.strptime(x, "%b %d %Y")
-        ).date(),
-    )
-    current_meter_reading: ConversionDescriptor = ConversionDescriptor(
-        _default=0, converter=_spaced_int
-    )
-    previous_date: ConversionDescriptor = ConversionDescriptor(
-        _default=date(1970, 1, 1),
-        converter=lambda x: (
-            datetime.strptime(x, "%b %d, %Y")
-            if "," in x
-            else datetime.strptime(x, "%b %d %Y")
-        ).date(),
-    )
-    previous_meter_reading: ConversionDescriptor = ConversionDescriptor(
-        _default=0, converter=_spaced_int
-    )
-    measured_therms: ConversionDescriptor = ConversionDescriptor(
-        _default=None, converter=_spaced_optional_int
-    )
-    thermal_factor: ConversionDescriptor = ConversionDescriptor(
-        _default=0.0, converter=_spaced_float
-    )
-    total_therms: ConversionDescriptor = ConversionDescriptor(
-        _default=0, converter=_spaced_int
-    )
-    delivery_min_rate_usd: ConversionDescriptor = ConversionDescriptor(
-        _default=0.4, converter=_spaced_optional_float
-    )
-    delivery_min_charge_usd: ConversionDescriptor = ConversionDescriptor(
-        _default=None, converter=_spaced_optional_float
-    )
-    delivery_first_tier_rate_usd: ConversionDescriptor = ConversionDescriptor(
-        _default=None, converter=_spaced_optional_float
-    )
-    delivery_off_peak_rate_usd: ConversionDescriptor = ConversionDescriptor(
-        _default=None, converter=_spaced_optional_float
-    )
-    delivery_distribution_adjustment_rate_usd: ConversionDescriptor = (
-        ConversionDescriptor(_default=0, converter=_spaced_float)
-    )
-    delivery_total_usd: ConversionDescriptor = ConversionDescriptor(
-        _default=0, converter=_spaced_float
-    )
-    supply_rate_usd: ConversionDescriptor = ConversionDescriptor(
-        _default=0, converter=_spaced_float
-    )
-    supply_total_usd: ConversionDescriptor = ConversionDescriptor(
-        _default=0, converter=_spaced_float
-    )
-    paperless_bill_credit_usd: ConversionDescriptor = ConversionDescriptor(
-        _default=0, converter=_spaced_float
-    )
-    total_usd: ConversionDescriptor = ConversionDescriptor(
-        _default=0, converter=_spaced_float
-    )
+    days_since_last_reading: int = 0
+    current_date: date = date(1970, 1, 1)
+    current_meter_reading: int = 0
+    previous_date: date = date(1970, 1, 1)
+    previous_meter_reading: int = 0
+    measured_therms: int | None = None
+    thermal_factor: float = 0.0
+    total_therms: int = 0
+    delivery_min_rate_usd: float = 0.4
+    delivery_min_charge_usd: float | None = None
+    delivery_first_tier_rate_usd: float = 0.0
+    delivery_off_peak_rate_usd: float | None = None
+    delivery_distribution_adjustment_rate_usd: float = 0.0
+    delivery_total_usd: float = 0.0
+    supply_rate_usd: float = 0.0
+    supply_total_usd: float = 0.0
+    paperless_bill_credit_usd: float = 0.0
+    total_usd: float = 0.0
 
-    _old_patterns: ClassVar[tuple[str, ...]] = (
+    # Possessive quantifiers and atomic groups keep a failed search from backtracking into
+    # the fields it has already consumed.
+    _old_patterns: ClassVar[tuple[re.Pattern[str], ...]] = compile_patterns(
+        r"In (?P<days_since_last_reading>\d++) days",
         (
-            r".*In (?P<days_since_last_reading>\d+) days"
-            r".*(?P<current_date>[a-zA-Z]{3} [0-9]{2} 20\d{2}) reading"
-            r" (?P<current_method>[^\s]*)             (?P<current_meter_reading>[. 0-9]*\d+)"
-            r".*(?P<previous_date>[a-zA-Z]{3} [0-9]{2} 20\d{2}) reading"
-            r" (?P<previous_method>[^\s]*)"
-            r" *(_ ?)* *(?P<previous_meter_reading>[. 0-9]*\d)"
-            r".*Thermal Factor.*x(?P<thermal_factor>[. 0-9]*\d+)"
-            r".*Total therms used *(?P<total_therms>[. 0-9]*\d)"
-            r".*\$(?P<delivery_min_rate_usd>[.0-9]+) per day for"
-            r".*First [.0-9]+ therms @ \$(?P<delivery_first_tier_rate_usd>[.0-9]+)"
-            r".*Distribution Adjustment"
-            r".*therms x (?P<delivery_distribution_adjustment_rate_usd>[.0-9]+) per therm"
-            r".*GAS DELIVERY CHARGE.*\$(?P<delivery_total_usd>[. 0-9]*\d)"
-            r".*GAS SUPPLY CHARGE"
-            r".*@ \$(?P<supply_rate_usd>[.0-9]+) /therm"
-            r".*Paperless Bill Credit.*(?P<paperless_bill_credit_usd>-[. 0-9]*\d)"
-            r".*TOTAL CURRENT CHARGES *\$(?P<total_usd>[. 0-9]*\d)"
-            r".*(IMPORTANT MESSAGES)?.*(ADDITIONAL MESSAGES)?"
+            # the only field without a literal anchor; months may be title or upper case, like in
+            # the current layout, which is why _parse_bill_date() normalizes them
+            r"(?P<current_date>[a-zA-Z]{3} [0-9]{2} 20\d{2}) reading"
+            r" (?P<current_method>[^\s]*+) ++(?P<current_meter_reading>(?>[. 0-9]*\d))"
+            r"[^\n]*+\n"
+            r"(?P<previous_date>[a-zA-Z]{3} [0-9]{2} 20\d{2}) reading"
+            r" (?P<previous_method>[^\s]*+)"
+            r" *+(?:_ ?)*+ *+(?P<previous_meter_reading>(?>[. 0-9]*\d))"
         ),
+        r"Thermal Factor *+x(?P<thermal_factor>(?>[. 0-9]*\d))",
+        r"Total therms used *+(?P<total_therms>(?>[. 0-9]*\d))",
+        r"\$(?P<delivery_min_rate_usd>[.0-9]++) per day for",
+        r"First [.0-9]++ therms @ \$(?P<delivery_first_tier_rate_usd>[.0-9]++)",
+        r"therms x (?P<delivery_distribution_adjustment_rate_usd>[.0-9]++) per therm",
+        r"GAS DELIVERY CHARGE *+\$(?P<delivery_total_usd>(?>[. 0-9]*\d))",
+        r"GAS SUPPLY CHARGE\s++@ \$(?P<supply_rate_usd>[.0-9]++) /therm",
+        r"Paperless Bill Credit[ _]*+(?P<paperless_bill_credit_usd>-(?>[. 0-9]*\d))",
+        r"TOTAL CURRENT CHARGES *+\$(?P<total_usd>(?>[. 0-9]*\d))",
     )
-    _current_patterns: ClassVar[tuple[str, ...]] = (
+    _current_patterns: ClassVar[tuple[re.Pattern[str], ...]] = compile_patterns(
         (
-            r".*BILLING PERIOD"
-            r".*(?P<previous_date>[a-zA-Z]{3} [0-9]{2}, 20\d{2})"
+            r"BILLING PERIOD[^\n]*+\n"
+            r"(?P<previous_date>[a-zA-Z]{3} [0-9]{2}, 20\d{2})"
             r" to (?P<current_date>[a-zA-Z]{3} [0-9]{2}, 20\d{2})"
-            r".*\$\s+(?P<total_usd>[.0-9]+)"
-            r".*DETAIL OF CURRENT CHARGES"
-            r".*Delivery Services"
-            r".*Service\s+Period.*No.\s+of\s+days.*Current\s+Reading.*Previous\s+Reading.*Measured"
-            r"\s+CCF.*Therm\s+Factor.*Therms\s+Used"
-            r".*\w{3}\s+\d{2}\s+-\s+\w{3}\s+\d{2}"
-            r" +(?P<days_since_last_reading>\d{2})"
-            r" +(?P<current_meter_reading>\d+) +(?P<current_method>\w+)"
-            r" +(?P<previous_meter_reading>\d+) +(?P<previous_method>\w+)"
-            r" +(?P<measured_therms>\d+)"
-            r" +(?P<thermal_factor>[.0-9]+)"
-            r" +(?P<total_therms>\d+)"
-            r".*RATE +R\-3B Residential Heating"
-            r".*Minimum Charge\s+(?P<delivery_min_charge_usd>[.0-9]+)"
-            r".*Delivery Off\-Peak\s+(?P<delivery_first_tier_rate_usd>[.0-9]+)\s*x\s*\d+ therms"
-            r".*Distribution Adjustment\s+(?P<delivery_distribution_adjustment_rate_usd>[.0-9]+)"
-            r"\s*x\s*\d+ therms"
-            r".*Total Delivery Services[ $]+(?P<delivery_total_usd>[.0-9]+)"
-            r".*Supply Services"
-            r".*SUPPLIER *National Grid"
-            r".*Gas Supply Off-Peak\s+(?P<supply_rate_usd>[.0-9]+)\s*x\s*\d+ therms"
-            r".*Total Supply Services[ $]+(?P<supply_total_usd>[.0-9]+)"
-            r".*Other Charges/Adjustments"
-            r".*Paperless Billing Credit\s+(?P<paperless_bill_credit_usd>[\-.0-9]+)"
-            r".*Total Other Charges/Adjustments"
         ),
+        r"\$\s++(?P<total_usd>[.0-9]++)\s++DETAIL OF CURRENT CHARGES",
+        (
+            r"Therms\s++Used\s++"
+            r"\w{3}\s++\d{2}\s++-\s++\w{3}\s++\d{2}"
+            r" ++(?P<days_since_last_reading>\d{2})"
+            r" ++(?P<current_meter_reading>\d++) ++(?P<current_method>\w++)"
+            r" ++(?P<previous_meter_reading>\d++) ++(?P<previous_method>\w++)"
+            r" ++(?P<measured_therms>\d++)"
+            r" ++(?P<thermal_factor>[.0-9]++)"
+            r" ++(?P<total_therms>\d++)"
+        ),
+        (
+            r"RATE ++R\-3B Residential Heating"
+            r"\s++Minimum Charge\s++(?P<delivery_min_charge_usd>[.0-9]++)"
+        ),
+        r"Delivery Off\-Peak\s++(?P<delivery_first_tier_rate_usd>[.0-9]++)\s*+x\s*+\d++ therms",
+        (
+            r"Distribution Adjustment\s++(?P<delivery_distribution_adjustment_rate_usd>[.0-9]++)"
+            r"\s*+x\s*+\d++ therms"
+        ),
+        r"Total Delivery Services[ $]++(?P<delivery_total_usd>[.0-9]++)",
+        (
+            r"SUPPLIER *+National Grid"
+            r"\s++Gas Supply Off-Peak\s++(?P<supply_rate_usd>[.0-9]++)\s*+x\s*+\d++ therms"
+        ),
+        r"Total Supply Services[ $]++(?P<supply_total_usd>[.0-9]++)",
+        r"Paperless Billing Credit\s++(?P<paperless_bill_credit_usd>[\-.0-9]++)",
     )
 
     _header: ClassVar[tuple[str, ...]] = (
@@ -199,7 +218,34 @@ class GasBill(Bill):
     )
 
     def __post_init__(self) -> None:
-        """Dataclass method invoked after __init__() to compute derived properties."""
+        """Dataclass method invoked after __init__() to convert fields and compute derived ones."""
+        self.days_since_last_reading = _spaced_int(self.days_since_last_reading)
+        self.current_date = _parse_bill_date(self.current_date)
+        self.current_meter_reading = _spaced_int(self.current_meter_reading)
+        self.previous_date = _parse_bill_date(self.previous_date)
+        self.previous_meter_reading = _spaced_int(self.previous_meter_reading)
+        self.measured_therms = _spaced_optional_int(self.measured_therms)
+        self.thermal_factor = _spaced_float(self.thermal_factor)
+        self.total_therms = _spaced_int(self.total_therms)
+        self.delivery_min_rate_usd = _spaced_float(self.delivery_min_rate_usd)
+        self.delivery_min_charge_usd = _spaced_optional_float(
+            self.delivery_min_charge_usd
+        )
+        self.delivery_first_tier_rate_usd = _spaced_float(
+            self.delivery_first_tier_rate_usd
+        )
+        self.delivery_off_peak_rate_usd = _spaced_optional_float(
+            self.delivery_off_peak_rate_usd
+        )
+        self.delivery_distribution_adjustment_rate_usd = _spaced_float(
+            self.delivery_distribution_adjustment_rate_usd
+        )
+        self.delivery_total_usd = _spaced_float(self.delivery_total_usd)
+        self.supply_rate_usd = _spaced_float(self.supply_rate_usd)
+        self.supply_total_usd = _spaced_float(self.supply_total_usd)
+        self.paperless_bill_credit_usd = _spaced_float(self.paperless_bill_credit_usd)
+        self.total_usd = _spaced_float(self.total_usd)
+
         if self.supply_total_usd == 0:
             self.supply_total_usd = round(self.total_therms * self.supply_rate_usd, 2)
         # TODO values that are inconsistent between layouts
@@ -207,17 +253,17 @@ class GasBill(Bill):
     @property
     @override
     def date(self) -> date:  # noqa: D102
-        d: date = self.current_date
-        return d
+        return self.current_date
 
     @override
     def validate(self) -> None:  # noqa: D102
         # TODO validation with fields that are inconsistent between bill layouts
-        calculated = self.current_date - self.previous_date
-        if calculated != timedelta(days=self.days_since_last_reading):
+        elapsed = self.current_date - self.previous_date
+        # compare whole days rather than building a timedelta to compare against
+        if elapsed.days != self.days_since_last_reading:
             raise ValueError(
                 f"Dates don't match: {self.current_date=}"
-                + f" {self.previous_date=} => {calculated=}"
+                + f" {self.previous_date=} => {elapsed=}"
                 + f" {self.days_since_last_reading=}"
             )
 
@@ -235,65 +281,53 @@ class GasBill(Bill):
                 + f" => {calculated=} != {self.total_therms=}"
             )
 
-        calculated = round(
+        # Compare money in whole cents: the rates have fractions of a cent, so the delivery total
+        # is rounded once, and the bill totals then add up exactly as integers.
+        calculated_cents = to_cents(
             self.days_since_last_reading * self.delivery_min_rate_usd
             + self.total_therms
             * (
                 self.delivery_first_tier_rate_usd
                 + self.delivery_distribution_adjustment_rate_usd
-            ),
-            2,
+            )
         )
-        if calculated != self.delivery_total_usd:
+        if calculated_cents != to_cents(self.delivery_total_usd):
             raise ValueError(
                 "Delivery rates and therms don't match total:"
                 + f" {self.total_therms=}"
                 + f" {self.delivery_min_rate_usd=}"
                 + f" {self.delivery_first_tier_rate_usd=}"
                 + f" {self.delivery_distribution_adjustment_rate_usd=}"
-                + f" => {calculated=}"
+                + f" => calculated_usd={calculated_cents / 100}"
                 + f" != {self.delivery_total_usd=}"
             )
 
-        calculated = round(
-            self.delivery_total_usd
-            + self.supply_total_usd
-            + self.paperless_bill_credit_usd,
-            2,
+        calculated_cents = (
+            to_cents(self.delivery_total_usd)
+            + to_cents(self.supply_total_usd)
+            + to_cents(self.paperless_bill_credit_usd)
         )
-        if calculated != self.total_usd:
+        if calculated_cents != to_cents(self.total_usd):
             raise ValueError(
                 f"Totals don't match: {self.delivery_total_usd=}"
                 + f" {self.supply_total_usd=}"
                 + f" {self.paperless_bill_credit_usd=}"
-                + f" => {calculated=} != {self.total_usd=}"
+                + f" => calculated_usd={calculated_cents / 100} != {self.total_usd=}"
             )
 
     @override
     def to_row(self) -> tuple[str | int | float, ...]:  # noqa: D102
-        return (
-            self.current_date.isoformat(),
-            self.days_since_last_reading,
-            self.current_meter_reading,
-            self.previous_meter_reading,
-            self.thermal_factor,
-            self.total_therms,
-            self.delivery_min_rate_usd,
-            self.delivery_first_tier_rate_usd,
-            self.delivery_distribution_adjustment_rate_usd,
-            self.delivery_total_usd,
-            self.supply_rate_usd,
-            self.supply_total_usd,
-            self.paperless_bill_credit_usd,
-            self.total_usd,
-        )
+        return (self.current_date.isoformat(), *_ROW_FIELDS(self))
 
     @override
     @classmethod
-    def pick_patterns(cls, text: str, reader: PdfReader) -> Iterable[str]:  # noqa: D102
-        if len(reader.pages) == 3:
-            logging.debug("Using new patterns")
+    def pick_patterns(  # noqa: D102
+        cls, text: str, reader: PdfReader
+    ) -> Iterable[re.Pattern[str]]:
+        # the current layout opens with the billing period, whatever its number of pages
+        if "BILLING PERIOD" in text:
+            _LOGGER.debug("Found BILLING PERIOD -> using new patterns")
             return cls._current_patterns
         else:
-            logging.debug("Found 2 pages -> using old patterns")
+            _LOGGER.debug("Using old patterns")
             return cls._old_patterns
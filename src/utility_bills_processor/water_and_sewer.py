@@ -1,11 +1,11 @@
 """Extracts a TSV line (with header line) from my Water/Sewer Bill PDF."""
 
 from dataclasses import dataclass
-from datetime import date, datetime
-from typing import ClassVar, override
+from datetime import date
+from operator import attrgetter
+from typing import ClassVar, Final, override
 
-from ._common.bill import Bill
-from ._common.dataclass_converters import ConversionDescriptor
+from ._common.bill import Bill, to_cents
 
 __EXAMPLE = """
 Usage History  \n
@@ -29,46 +29,60 @@ Pay This Amount  \n
 """
 
 
-@dataclass
+def _parse_read_date(value: str | date) -> date:
+    """Parse "11/25/2023", like `strptime` with "%m/%d/%Y" without interpreting a format string."""
+    if isinstance(value, date):
+        return value
+    month, day, year = value.split("/")
+    return date(int(year), int(month), int(day))
+
+
+# the to_row() values after the date, fetched in one C-level call
+_ROW_FIELDS: Final = attrgetter(
+    "current_meter_reading",
+    "usage_type",
+    "usage",
+    "water_charge",
+    "sewer_charge",
+    "past_due",
+    "interest",
+    "adjustments",
+    "total",
+)
+
+
+@dataclass(slots=True)
 class WaterBill(Bill):
-    """A Data Object representation of a Water Bill."""
+    """A Data Object representation of a Water Bill.
+
+    Fields may be given as the text extracted from the bill; `__post_init__` converts them once.
+    """
 
     usage_type: str
-    read_date: ConversionDescriptor = ConversionDescriptor(
-        _default=datetime(1970, 1, 1),
-        converter=lambda x: datetime.strptime(x, "%m/%d/%Y").date(),
-    )
-    current_meter_reading: ConversionDescriptor = ConversionDescriptor(
-        _default=0, converter=int
-    )
-    usage: ConversionDescriptor = ConversionDescriptor(_default=0, converter=int)
-    water_charge: ConversionDescriptor = ConversionDescriptor(
-        _default=0, converter=float
-    )
-    sewer_charge: ConversionDescriptor = ConversionDescriptor(
-        _default=0, converter=float
-    )
-    past_due: ConversionDescriptor = ConversionDescriptor(_default=0, converter=float)
-    interest: ConversionDescriptor = ConversionDescriptor(_default=0, converter=float)
-    adjustments: ConversionDescriptor = ConversionDescriptor(
-        _default=0, converter=float
-    )
-    total: ConversionDescriptor = ConversionDescriptor(_default=0, converter=float)
+    read_date: date = date(1970, 1, 1)
+    current_meter_reading: int = 0
+    usage: int = 0
+    water_charge: float = 0.0
+    sewer_charge: float = 0.0
+    past_due: float = 0.0
+    interest: float = 0.0
+    adjustments: float = 0.0
+    total: float = 0.0
 
     _patterns: ClassVar[tuple[str, ...]] = (
         (
-            r".*Meter Number Read Date Reading Usage Type Usage Description Charge.*"
-            r"?(?P<read_date>\d\d/\d\d/\d\d\d\d)"
-            r"? +(?P<current_meter_reading>\d+)"
-            r"? +(?P<usage_type>[^ ]+)"
-            r"? +(?P<usage>\d+)"
+            r"Meter Number Read Date Reading Usage Type Usage Description Charge\s++"
+            r"(?:\d++ ++)?(?P<read_date>\d\d/\d\d/\d\d\d\d)"
+            r" ++(?P<current_meter_reading>\d++)"
+            r" ++(?P<usage_type>[^ ]++)"
+            r" ++(?P<usage>\d++)"
         ),
-        r"WATER +\$(?P<water_charge>\d+.\d{2})",
-        r"SEWER +\$(?P<sewer_charge>\d+.\d{2})",
-        r"Past Due +\$(?P<past_due>\d+.\d{2})",
-        r"Interest +\$(?P<interest>\d+.\d{2})",
-        r"Adjustments +\$(?P<adjustments>\d+.\d{2})",
-        r"Total Due +\$(?P<total>\d+.\d{2})",
+        r"WATER ++\$(?P<water_charge>\d++\.\d{2})",
+        r"SEWER ++\$(?P<sewer_charge>\d++\.\d{2})",
+        r"Past Due ++\$(?P<past_due>\d++\.\d{2})",
+        r"Interest ++\$(?P<interest>\d++\.\d{2})",
+        r"Adjustments ++\$(?P<adjustments>\d++\.\d{2})",
+        r"Total Due ++\$(?P<total>\d++\.\d{2})",
     )
     _header: ClassVar[tuple[str, ...]] = (
         "read_date",
@@ -83,24 +97,33 @@ class WaterBill(Bill):
         "total_usd",
     )
 
+    def __post_init__(self) -> None:
+        """Dataclass method invoked after __init__() to convert fields."""
+        self.read_date = _parse_read_date(self.read_date)
+        self.current_meter_reading = int(self.current_meter_reading)
+        self.usage = int(self.usage)
+        self.water_charge = float(self.water_charge)
+        self.sewer_charge = float(self.sewer_charge)
+        self.past_due = float(self.past_due)
+        self.interest = float(self.interest)
+        self.adjustments = float(self.adjustments)
+        self.total = float(self.total)
+
     @property
     @override
     def date(self) -> date:  # noqa: D102
-        # ensure typing works
-        d: date = self.read_date
-        return d
+        return self.read_date
 
     @override
     def validate(self) -> None:  # noqa: D102
-        calculated = round(
-            self.water_charge
-            + self.sewer_charge
-            + self.past_due
-            + self.interest
-            + self.adjustments,
-            2,
+        calculated_cents = (
+            to_cents(self.water_charge)
+            + to_cents(self.sewer_charge)
+            + to_cents(self.past_due)
+            + to_cents(self.interest)
+            + to_cents(self.adjustments)
         )
-        if self.total != calculated:
+        if to_cents(self.total) != calculated_cents:
             raise ValueError(
                 "Changes don't sum to the total due."
                 + f" {self.water_charge=}"
@@ -108,21 +131,10 @@ class WaterBill(Bill):
                 + f" {self.past_due=}"
                 + f" {self.adjustments=}"
                 + f" {self.interest=}"
-                + f" => {calculated=} != {self.total=}"
+                + f" => calculated_usd={calculated_cents / 100} != {self.total=}"
             )
         # TODO extract rate to check usage against charges
 
     @override
     def to_row(self) -> tuple[str | int | float, ...]:  # noqa: D102
-        return (
-            self.read_date.isoformat(),
-            self.current_meter_reading,
-            self.usage_type,
-            self.usage,
-            self.water_charge,
-            self.sewer_charge,
-            self.past_due,
-            self.interest,
-            self.adjustments,
-            self.total,
-        )
+        return (self.read_date.isoformat(), *_ROW_FIELDS(self))
@@ -0,0 +1,223 @@
+"""The CLI processes bill files into CSV rows."""
+
+import inspect
+import shelve  # noqa: S403
+import subprocess  # noqa: S404
+import sys
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from click.testing import CliRunner
+
+from utility_bills_processor import cli
+from utility_bills_processor._common import executors
+from utility_bills_processor.national_grid_gas import GasBill
+from utility_bills_processor.water_and_sewer import WaterBill
+
+DATA_ROOT = Path(__file__).parents[1].joinpath("tests_data")
+OLD_GAS_BILL_PATH = DATA_ROOT.joinpath("gas-old.pdf")
+GAS_BILL_PATH = DATA_ROOT.joinpath("gas.pdf")
+WATER_BILL_PATH = DATA_ROOT.joinpath("municipal-water-sewer.pdf")
+
+
+def _raise_runtime_error(*args: object) -> GasBill:
+    raise RuntimeError("not expected to be called")
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    """Instantiate the click.CliRunner as a pytest.fixture."""
+    return CliRunner()
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep the parsed bills cache of each test in a temporary directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return tmp_path
+
+
+def test_gas_many_files(runner: CliRunner) -> None:
+    """It outputs a header and one row per bill, sorted by date."""
+    result = runner.invoke(
+        cli.process_utility_bill, ["gas", str(GAS_BILL_PATH), str(OLD_GAS_BILL_PATH)]
+    )
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    assert lines[1].startswith("current_date, days_since_last_reading")
+    assert lines[2].startswith("2024-04-19,")
+    assert lines[3].startswith("2024-07-20,")
+    assert len(lines) == 4
+
+
+def test_gas_wrong_bill_type(runner: CliRunner) -> None:
+    """It names the file that couldn't be processed."""
+    result = runner.invoke(
+        cli.process_utility_bill, ["gas", str(GAS_BILL_PATH), str(WATER_BILL_PATH)]
+    )
+    assert result.exit_code != 0
+    assert f"Failed to process as a gas bill: {WATER_BILL_PATH}" in result.output
+
+
+def test_gas_cached(runner: CliRunner, monkeypatch: pytest.MonkeyPatch) -> None:
+    """It reuses the bills parsed by an earlier run instead of reading the files again."""
+    args = ["gas", str(GAS_BILL_PATH), str(OLD_GAS_BILL_PATH)]
+    first = runner.invoke(cli.process_utility_bill, args)
+
+    monkeypatch.setattr(GasBill, "extract_fields", _raise_runtime_error)
+    second = runner.invoke(cli.process_utility_bill, args)
+    assert second.exit_code == 0, second.output
+    assert second.output == first.output
+
+    uncached = runner.invoke(cli.process_utility_bill, ["gas", "--no-cache", *args[1:]])
+    assert uncached.exit_code != 0
+    assert "Failed to process as a gas bill" in uncached.output
+
+
+def test_gas_duplicate_files(
+    runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It parses a file given more than once a single time, but outputs every row."""
+    calls: list[Path] = []
+    extract_fields = GasBill.extract_fields
+
+    def counting_extract_fields(bill_file: Path, password: str | None) -> GasBill:
+        calls.append(bill_file)
+        return extract_fields(bill_file, password)
+
+    monkeypatch.setattr(GasBill, "extract_fields", counting_extract_fields)
+    result = runner.invoke(
+        cli.process_utility_bill,
+        ["gas", "--no-cache", str(GAS_BILL_PATH), str(GAS_BILL_PATH)],
+    )
+    assert result.exit_code == 0, result.output
+    assert calls == [GAS_BILL_PATH]
+    lines = result.output.splitlines()
+    assert lines[2] == lines[3]
+    assert len(lines) == 4
+
+
+def test_gas_cached_by_contents(
+    runner: CliRunner, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """It reuses a parsed bill for a copy of the same file."""
+    first = runner.invoke(cli.process_utility_bill, ["gas", str(GAS_BILL_PATH)])
+    copied = tmp_path.joinpath("copy.pdf")
+    copied.write_bytes(GAS_BILL_PATH.read_bytes())
+
+    monkeypatch.setattr(GasBill, "extract_fields", _raise_runtime_error)
+    second = runner.invoke(cli.process_utility_bill, ["gas", str(copied)])
+    assert second.exit_code == 0, second.output
+    assert second.output == first.output
+
+
+def test_gas_single_file_in_process(
+    runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It doesn't start worker processes to parse a single file."""
+    monkeypatch.setattr(executors, "ProcessPoolExecutor", None)
+    result = runner.invoke(cli.process_utility_bill, ["gas", str(GAS_BILL_PATH)])
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines()[2].startswith("2024-07-20,")
+
+
+def test_import_skips_pdf_libraries() -> None:
+    """Loading the CLI, e.g. for --help and --version, doesn't import pypdf."""
+    code = "import sys, utility_bills_processor.cli; print('pypdf' in sys.modules)"
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout == "False\n"
+
+
+def _raise_on_load() -> None:
+    raise AttributeError("a field added since this bill was cached")
+
+
+class _Unloadable:
+    def __reduce__(self) -> tuple[Callable[[], None], tuple[()]]:
+        return _raise_on_load, ()
+
+
+def test_gas_unloadable_cache_entry(runner: CliRunner, cache_home: Path) -> None:
+    """It parses the file again when its cached bill can't be loaded."""
+    key = cli._cache_key(cli._parser_fingerprint(GasBill), GAS_BILL_PATH)
+    cache_dir = cache_home / "utility_bills_processor"
+    cache_dir.mkdir()
+    with shelve.open(str(cache_dir / "bills")) as shelf:  # noqa: S301
+        shelf[key] = _Unloadable()
+
+    result = runner.invoke(cli.process_utility_bill, ["gas", str(GAS_BILL_PATH)])
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines()[2].startswith("2024-07-20,")
+
+
+def test_gas_corrupt_cache(runner: CliRunner, cache_home: Path) -> None:
+    """It runs without the cache when the store can't be opened."""
+    cache_dir = cache_home / "utility_bills_processor"
+    cache_dir.mkdir()
+    cache_dir.joinpath("bills.dat").write_bytes(b"")
+    cache_dir.joinpath("bills.dir").write_text("not an index\n")
+
+    result = runner.invoke(cli.process_utility_bill, ["gas", str(GAS_BILL_PATH)])
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines()[-1].startswith("2024-07-20,")
+
+
+def _raise_os_error_on_store(*args: object) -> None:
+    raise OSError("read-only cache")
+
+
+def test_gas_unwritable_cache(
+    runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It still prints bills that can't be saved to the cache."""
+    monkeypatch.setattr(shelve.Shelf, "__setitem__", _raise_os_error_on_store)
+    result = runner.invoke(cli.process_utility_bill, ["gas", str(GAS_BILL_PATH)])
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines()[-1].startswith("2024-07-20,")
+
+
+def test_parser_fingerprint() -> None:
+    """It tells the parsing code of each type of bill apart."""
+    assert cli._parser_fingerprint(GasBill) == cli._parser_fingerprint(GasBill)
+    assert cli._parser_fingerprint(GasBill) != cli._parser_fingerprint(WaterBill)
+
+
+def test_gas_uncached_skips_hashing(
+    runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It doesn't read files for cache keys when the cache is off."""
+    monkeypatch.setattr(cli, "_cache_key", _raise_runtime_error)
+    result = runner.invoke(
+        cli.process_utility_bill, ["gas", "--no-cache", str(GAS_BILL_PATH)]
+    )
+    assert result.exit_code == 0, result.output
+
+
+def test_gas_cache_hits_not_rewritten(
+    runner: CliRunner, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """It only writes the bills it parsed to the cache."""
+    args = ["gas", str(GAS_BILL_PATH)]
+    runner.invoke(cli.process_utility_bill, args)
+
+    monkeypatch.setattr(shelve.Shelf, "__setitem__", _raise_runtime_error)
+    result = runner.invoke(cli.process_utility_bill, args)
+    assert result.exit_code == 0, result.output
+
+
+def _raise_os_error(*args: object) -> str:
+    raise OSError("could not get source code")
+
+
+def test_gas_without_sources(
+    runner: CliRunner, monkeypatch: pytest.MonkeyPatch, cache_home: Path
+) -> None:
+    """It runs without the cache when the parsing code can't be read to fingerprint it."""
+    monkeypatch.setattr(inspect, "getsource", _raise_os_error)
+    result = runner.invoke(cli.process_utility_bill, ["gas", str(GAS_BILL_PATH)])
+    assert result.exit_code == 0, result.output
+    assert result.output.splitlines()[-1].startswith("2024-07-20,")
+    assert not cache_home.joinpath("utility_bills_processor").exists()
@@ -1,9 +1,11 @@
 """The GasBill extracts, validates, and outputs the data correctly."""
 
+import re
 from datetime import date
 from pathlib import Path
 
 import pytest
+from pypdf import PageObject, PdfReader
 
 from utility_bills_processor.national_grid_gas import GasBill
 
@@ -59,6 +61,64 @@ def test_extract_fields() -> None:
     assert bill.total_usd == 19.25
 
 
+def test_extract_fields_stops_at_last_needed_page(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """It doesn't extract text from the pages after the ones holding the fields."""
+    extracted = []
+    extract_text = PageObject.extract_text
+
+    def counting_extract_text(page: PageObject) -> str:
+        extracted.append(page.page_number)
+        return extract_text(page)
+
+    monkeypatch.setattr(PageObject, "extract_text", counting_extract_text)
+    GasBill.extract_fields(OLD_BILL_PATH)
+    GasBill.extract_fields(BILL_PATH)
+    # old layout: 1 of 2 pages, current layout: 2 of 3 pages
+    assert extracted == [0, 0, 1]
+
+
+class _RecordingPattern:
+    """Wraps a compiled pattern to record the text of every search."""
+
+    def __init__(self, pattern: re.Pattern[str], searched: list[str]) -> None:
+        self.pattern = pattern.pattern
+        self.groupindex = pattern.groupindex
+        self._pattern = pattern
+        self._searched = searched
+
+    def search(self, text: str) -> re.Match[str] | None:
+        self._searched.append(text)
+        return self._pattern.search(text)
+
+
+def test_extract_fields_skips_blank_pages(monkeypatch: pytest.MonkeyPatch) -> None:
+    """It doesn't search the unmatched patterns again after a page without text."""
+    expected = GasBill.extract_fields(BILL_PATH)
+    extract_text = PageObject.extract_text
+    first_page, second_page, _ = (
+        extract_text(page) for page in PdfReader(BILL_PATH).pages
+    )
+
+    def blank_second_page(page: PageObject) -> str:
+        # the current layout's pages shifted back by a blank one
+        return {0: first_page, 1: "", 2: second_page}[page.page_number]
+
+    searched: list[str] = []
+    monkeypatch.setattr(PageObject, "extract_text", blank_second_page)
+    monkeypatch.setattr(
+        GasBill,
+        "_current_patterns",
+        tuple(_RecordingPattern(p, searched) for p in GasBill._current_patterns),
+    )
+    assert GasBill.extract_fields(BILL_PATH) == expected
+    assert sorted(set(searched), key=len) == [
+        first_page,
+        f"{first_page}\n\n{second_page}",
+    ]
+
+
 def test_date_set() -> None:
     """It validates that the date property is the same as the current_date."""
     bill = GasBill.extract_fields(BILL_PATH)
@@ -76,7 +136,9 @@ def test_validate_inaccurate_total() -> None:
     """It finds an issue when the total doesn't match the line values."""
     bill = GasBill.extract_fields(OLD_BILL_PATH)
     bill.total_usd = -100
-    with pytest.raises(ValueError):
+    with pytest.raises(
+        ValueError, match="calculated_usd=112.07 != self.total_usd=-100"
+    ):
         bill.validate()
 
 
@@ -119,3 +181,45 @@ def test_to_row() -> None:
         bill.paperless_bill_credit_usd,
         bill.total_usd,
     )
+
+
+def test_extract_fields_wrong_bill() -> None:
+    """It names the fields it couldn't find."""
+    with pytest.raises(
+        RuntimeError,
+        match="Cannot parse bill fields days_since_last_reading, current_date",
+    ):
+        GasBill.extract_fields(DATA_ROOT.joinpath("municipal-water-sewer.pdf"))
+
+
+def test_extract_many() -> None:
+    """It extracts a bill per file, in the order of the files."""
+    bills = GasBill.extract_many([BILL_PATH, OLD_BILL_PATH], max_workers=2)
+    assert [bill.date for bill in bills] == [date(2024, 7, 20), date(2024, 4, 19)]
+
+
+def test_extract_fields_old_bill_upper_case_months(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """It accepts months in upper case, like "APR", in the old style readings."""
+    extract_text = PageObject.extract_text
+
+    def upper_case_months(page: PageObject) -> str:
+        return (
+            extract_text(page).replace("Apr 19", "APR 19").replace("Mar 19", "MAR 19")
+        )
+
+    monkeypatch.setattr(PageObject, "extract_text", upper_case_months)
+    bill = GasBill.extract_fields(OLD_BILL_PATH)
+    assert bill.current_date == date(2024, 4, 19)
+    assert bill.previous_date == date(2024, 3, 19)
+
+
+def test_extract_many_names_failed_file() -> None:
+    """It names the file that couldn't be parsed."""
+    water_bill_path = DATA_ROOT.joinpath("municipal-water-sewer.pdf")
+    with pytest.raises(
+        RuntimeError,
+        match=f"Cannot parse bill file {re.escape(str(water_bill_path))}: ",
+    ):
+        GasBill.extract_many([BILL_PATH, water_bill_path], max_workers=2)